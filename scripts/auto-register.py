@@ -10,11 +10,9 @@ Note: Full automation is not possible due to CAPTCHAs and email verification.
 This script assists by opening the correct pages and providing step-by-step guidance.
 """
 
-import os
+import subprocess
 import sys
-import time
-import webbrowser
-from pathlib import Path
+from typing import List, Optional
 
 # ANSI color codes
 class Colors:
@@ -26,6 +24,17 @@ class Colors:
     BOLD = '\033[1m'
     NC = '\033[0m'  # No Color
 
+# Skip ANSI escapes entirely when output is piped or captured
+if not sys.stdout.isatty():
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = ''
+    Colors.CYAN = Colors.BOLD = Colors.NC = ''
+
+# Message prefixes, built once instead of on every call
+_SUCCESS = f"{Colors.GREEN}✓{Colors.NC} "
+_ERROR = f"{Colors.RED}✗{Colors.NC} "
+_WARNING = f"{Colors.YELLOW}⚠{Colors.NC} "
+_INFO = f"{Colors.CYAN}ℹ{Colors.NC} "
+
 def print_header():
     """Print script header"""
     print(f"{Colors.CYAN}{Colors.BOLD}")
@@ -42,19 +51,19 @@ def print_section(title: str):
 
 def print_success(message: str):
     """Print success message"""
-    print(f"{Colors.GREEN}✓{Colors.NC} {message}")
+    sys.stdout.write(_SUCCESS + message + '\n')
 
 def print_error(message: str):
     """Print error message"""
-    print(f"{Colors.RED}✗{Colors.NC} {message}")
+    sys.stdout.write(_ERROR + message + '\n')
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠{Colors.NC} {message}")
+    sys.stdout.write(_WARNING + message + '\n')
 
 def print_info(message: str):
     """Print info message"""
-    print(f"{Colors.CYAN}ℹ{Colors.NC} {message}")
+    sys.stdout.write(_INFO + message + '\n')
 
 def print_step(number: int, message: str):
     """Print numbered step"""
@@ -64,12 +73,39 @@ def prompt_continue():
     """Prompt user to continue"""
     input(f"\n{Colors.YELLOW}Press Enter to continue...{Colors.NC}")
 
+def browser_command(url: str) -> Optional[List[str]]:
+    """Return the platform opener command for a URL, if one is known"""
+    if sys.platform.startswith('linux'):
+        return ['xdg-open', url]
+    if sys.platform == 'darwin':
+        return ['open', url]
+    if sys.platform == 'win32':
+        return ['cmd', '/c', 'start', '', url]
+    return None
+
+def launch_browser(url: str):
+    """Launch URL in default browser without waiting for it to start"""
+    command = browser_command(url)
+    if command:
+        try:
+            subprocess.Popen(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            return
+        except OSError:
+            pass  # Opener missing (e.g. no xdg-open); let webbrowser find a browser
+    
+    import webbrowser  # Fallback for unknown platforms or a missing opener
+    webbrowser.open(url)
+
 def open_browser(url: str):
     """Open URL in default browser"""
     print_info(f"Opening: {url}")
     try:
-        webbrowser.open(url)
-        time.sleep(2)  # Give browser time to open
+        launch_browser(url)
         return True
     except Exception as e:
         print_error(f"Failed to open browser: {e}")
@@ -83,6 +119,10 @@ def guide_coingecko():
     print("CoinGecko provides cryptocurrency market data.")
     print("You'll need to create an account to get an API key.\n")
     
+    # The pricing page is public, so let it load while the user picks a plan
+    open_browser("https://www.coingecko.com/en/api/pricing")
+    print()
+    
     print_step(1, "Choose your plan:")
     print("   • Demo (Free): 30 calls/minute, 10,000 calls/month")
     print("   • Analyst ($129/month): 500 calls/minute, unlimited calls\n")
@@ -94,8 +134,7 @@ def guide_coingecko():
         print_info("Defaulting to Demo plan")
     
     print()
-    print_step(2, "Opening CoinGecko API pricing page...")
-    open_browser("https://www.coingecko.com/en/api/pricing")
+    print_step(2, "Switch to the CoinGecko API pricing page opened above")
     
     print()
     print_step(3, "In your browser:")
@@ -7,14 +7,24 @@ diagnostics about their status, rate limits, and capabilities.
 """
 
 import os
+import re
 import sys
 import json
 import time
+import hashlib
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Tuple, Optional
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # ANSI color codes
 class Colors:
     RED = '\033[0;31m'
@@ -25,6 +35,38 @@ class Colors:
     BOLD = '\033[1m'
     NC = '\033[0m'  # No Color
 
+# Skip ANSI escapes entirely when output is piped or captured
+if not sys.stdout.isatty():
+    Colors.RED = Colors.GREEN = Colors.YELLOW = Colors.BLUE = ''
+    Colors.CYAN = Colors.BOLD = Colors.NC = ''
+
+# Message prefixes, built once instead of on every call
+_SUCCESS = f"{Colors.GREEN}✓{Colors.NC} "
+_ERROR = f"{Colors.RED}✗{Colors.NC} "
+_WARNING = f"{Colors.YELLOW}⚠{Colors.NC} "
+_INFO = f"{Colors.CYAN}ℹ{Colors.NC} "
+
+# Reports younger than this are reused instead of re-probing every service
+DEFAULT_MAX_AGE = 300
+REPORT_FILENAME = 'api-keys-validation-report.json'
+CREDENTIAL_VARS = ('COINGECKO_API_KEY', 'ETHERSCAN_API_KEY', 'GITHUB_TOKEN')
+# Only these outcomes are reused; timeouts, errors and rate limits are always retried
+CACHEABLE_STATUSES = ('valid', 'invalid', 'not_configured')
+REPORT_FIELDS = {'service', 'valid', 'status', 'message', 'details'}
+
+# Expected credential formats, checked before spending a network round-trip
+COINGECKO_KEY_RE = re.compile(r'CG-[A-Za-z0-9]{20,}')
+ETHERSCAN_KEY_RE = re.compile(r'[A-Z0-9]{32,34}')
+GITHUB_TOKEN_RE = re.compile(r'gh[pousr]_[A-Za-z0-9]{36,}|github_pat_[A-Za-z0-9_]{20,}|[0-9a-f]{40}')
+
+# (connect, read) timeouts in seconds: unreachable hosts fail fast on connect
+REQUEST_TIMEOUT = (3, 7)
+
+# Shared HTTP session so connections and TLS sessions are reused across probes
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+SESSION.headers.update({'User-Agent': 'cfv-metrics-validator/1.0'})
+
 def print_header():
     """Print script header"""
     print(f"{Colors.CYAN}{Colors.BOLD}")
@@ -41,19 +83,19 @@ def print_section(title: str):
 
 def print_success(message: str):
     """Print success message"""
-    print(f"{Colors.GREEN}✓{Colors.NC} {message}")
+    sys.stdout.write(_SUCCESS + message + '\n')
 
 def print_error(message: str):
     """Print error message"""
-    print(f"{Colors.RED}✗{Colors.NC} {message}")
+    sys.stdout.write(_ERROR + message + '\n')
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠{Colors.NC} {message}")
+    sys.stdout.write(_WARNING + message + '\n')
 
 def print_info(message: str):
     """Print info message"""
-    print(f"{Colors.CYAN}ℹ{Colors.NC} {message}")
+    sys.stdout.write(_INFO + message + '\n')
 
 def load_env_file(env_path: str) -> Dict[str, str]:
     """Load environment variables from .env file"""
@@ -63,12 +105,14 @@ def load_env_file(env_path: str) -> Dict[str, str]:
         print_error(f".env file not found: {env_path}")
         return env_vars
     
-    with open(env_path, 'r') as f:
+    with open(env_path, 'r', buffering=65536) as f:
         for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and '=' in line:
-                key, value = line.split('=', 1)
-                env_vars[key.strip()] = value.strip()
+            key, sep, value = line.partition('=')
+            if not sep:
+                continue
+            key = key.strip()
+            if key and not key.startswith('#'):
+                env_vars[key] = value.strip()
     
     return env_vars
 
@@ -86,12 +130,17 @@ def validate_coingecko(api_key: Optional[str]) -> Tuple[bool, Dict]:
         result['message'] = 'API key not configured'
         return False, result
     
+    if not COINGECKO_KEY_RE.fullmatch(api_key):
+        result['status'] = 'invalid'
+        result['message'] = 'API key format is invalid (expected CG-xxxxxxxxxxxxxxxxxxxx)'
+        return False, result
+    
     try:
         # Test ping endpoint
-        response = requests.get(
+        response = SESSION.get(
             'https://api.coingecko.com/api/v3/ping',
             headers={'x-cg-demo-api-key': api_key},
-            timeout=10
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -143,16 +192,21 @@ def validate_etherscan(api_key: Optional[str]) -> Tuple[bool, Dict]:
         result['message'] = 'API key not configured'
         return False, result
     
+    if not ETHERSCAN_KEY_RE.fullmatch(api_key):
+        result['status'] = 'invalid'
+        result['message'] = 'API key format is invalid (expected 32-34 uppercase letters and digits)'
+        return False, result
+    
     try:
         # Test with ETH price endpoint
-        response = requests.get(
+        response = SESSION.get(
             f'https://api.etherscan.io/api',
             params={
                 'module': 'stats',
                 'action': 'ethprice',
                 'apikey': api_key
             },
-            timeout=10
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -199,12 +253,17 @@ def validate_github(token: Optional[str]) -> Tuple[bool, Dict]:
         result['message'] = 'Token not configured'
         return False, result
     
+    if not GITHUB_TOKEN_RE.fullmatch(token):
+        result['status'] = 'invalid'
+        result['message'] = 'Token format is invalid (expected ghp_..., github_pat_... or a 40-character hex token)'
+        return False, result
+    
     try:
         # Test with rate limit endpoint
-        response = requests.get(
+        response = SESSION.get(
             'https://api.github.com/rate_limit',
             headers={'Authorization': f'token {token}'},
-            timeout=10
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -265,25 +324,93 @@ def print_validation_result(result: Dict):
         for key, value in details.items():
             print(f"  {key}: {value}")
 
-def generate_report(results: Dict[str, Tuple[bool, Dict]]) -> str:
+def credentials_fingerprint(env_vars: Dict[str, str]) -> str:
+    """Hash the configured credentials so a cached report can detect key rotation"""
+    digest = hashlib.sha256()
+    for name in CREDENTIAL_VARS:
+        digest.update(f"{name}={env_vars.get(name, '')}\0".encode())
+    return digest.hexdigest()
+
+def load_cached_report(report_file: Path, fingerprint: str, max_age: float) -> Optional[Dict]:
+    """Return a previous report if it is fresh and was built from the same credentials"""
+    try:
+        age = time.time() - report_file.stat().st_mtime
+    except OSError:
+        return None
+    
+    if age > max_age:
+        return None
+    
+    try:
+        with open(report_file, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if report.get('credentials_hash') != fingerprint:
+        return None
+    
+    # Reports from older versions lack fields needed to replay them
+    results = report.get('results')
+    if not results or any(
+        not REPORT_FIELDS <= entry.keys() or entry['status'] not in CACHEABLE_STATUSES
+        for entry in results.values()
+    ):
+        return None
+    
+    return report
+
+def results_from_report(report: Dict) -> Dict[str, Tuple[bool, Dict]]:
+    """Rebuild validator results from a saved report"""
+    return {
+        service: (entry['valid'], {
+            'service': entry['service'],
+            'status': entry['status'],
+            'message': entry['message'],
+            'details': entry['details']
+        })
+        for service, entry in report['results'].items()
+    }
+
+def dumps_json(data: Dict) -> str:
+    """Serialize data as indented JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+def generate_report(results: Dict[str, Tuple[bool, Dict]], fingerprint: str) -> str:
     """Generate JSON report of validation results"""
     report = {
         'timestamp': datetime.now().isoformat(),
+        'credentials_hash': fingerprint,
         'results': {}
     }
     
     for service, (valid, result) in results.items():
         report['results'][service] = {
+            'service': result['service'],
             'valid': valid,
             'status': result['status'],
             'message': result['message'],
             'details': result['details']
         }
     
-    return json.dumps(report, indent=2)
+    return dumps_json(report)
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description='Validate configured CFV Metrics Agent API keys')
+    parser.add_argument('--force', action='store_true',
+                        help='Revalidate even if a recent report exists')
+    parser.add_argument('--max-age', type=float, default=DEFAULT_MAX_AGE, metavar='SECONDS',
+                        help=f'Reuse a report younger than this many seconds (default: {DEFAULT_MAX_AGE})')
+    parser.add_argument('-v', '--print-report', action='store_true',
+                        help='Also print the JSON report to stdout')
+    return parser.parse_args()
 
 def main():
     """Main function"""
+    args = parse_args()
     print_header()
     
     # Determine project directory
@@ -304,50 +431,60 @@ def main():
     
     print_success(f"Loaded {len(env_vars)} environment variables")
     
-    # Validate each API key
-    print_section("Validating API Keys")
+    report_file = project_dir / REPORT_FILENAME
+    fingerprint = credentials_fingerprint(env_vars)
     
-    results = {}
+    # Reuse a recent report when the keys have not changed since it was written
+    cached = None if args.force else load_cached_report(report_file, fingerprint, args.max_age)
     
-    # CoinGecko
-    print("Testing CoinGecko API key...")
-    coingecko_key = env_vars.get('COINGECKO_API_KEY')
-    valid, result = validate_coingecko(coingecko_key)
-    results['coingecko'] = (valid, result)
-    print_validation_result(result)
-    print()
-    time.sleep(1)  # Rate limiting
-    
-    # Etherscan
-    print("Testing Etherscan API key...")
-    etherscan_key = env_vars.get('ETHERSCAN_API_KEY')
-    valid, result = validate_etherscan(etherscan_key)
-    results['etherscan'] = (valid, result)
-    print_validation_result(result)
-    print()
-    time.sleep(1)  # Rate limiting
-    
-    # GitHub
-    print("Testing GitHub token...")
-    github_token = env_vars.get('GITHUB_TOKEN')
-    valid, result = validate_github(github_token)
-    results['github'] = (valid, result)
-    print_validation_result(result)
-    print()
+    if cached is not None:
+        print_section("Cached Validation Results")
+        print_info(f"Using report from {cached['timestamp']} (run with --force to revalidate)")
+        print()
+        results = results_from_report(cached)
+    else:
+        print_section("Validating API Keys")
+        
+        validators = [
+            ('coingecko', 'CoinGecko API key', validate_coingecko, env_vars.get('COINGECKO_API_KEY')),
+            ('etherscan', 'Etherscan API key', validate_etherscan, env_vars.get('ETHERSCAN_API_KEY')),
+            ('github', 'GitHub token', validate_github, env_vars.get('GITHUB_TOKEN')),
+        ]
+        
+        # Each service lives on a different host, so probe them concurrently
+        print("Testing " + ", ".join(label for _, label, _, _ in validators) + "...")
+        print()
+        
+        with ThreadPoolExecutor(max_workers=len(validators)) as executor:
+            futures = {
+                executor.submit(validate, credential): service
+                for service, _, validate, credential in validators
+            }
+            completed = {futures[future]: future.result() for future in as_completed(futures)}
+        
+        # Keep a stable order regardless of completion order
+        results = {service: completed[service] for service, _, _, _ in validators}
+    
+    for _, result in results.values():
+        print_validation_result(result)
+        print()
     
     # Summary
     print_section("Summary")
     
     total = len(results)
-    valid_count = sum(1 for v, _ in results.values() if v)
-    configured_count = sum(1 for _, r in results.values() if r[1]['status'] != 'not_configured')
+    valid_count = configured_count = 0
+    for valid, result in results.values():
+        configured_count += result['status'] != 'not_configured'
+        valid_count += valid
+    all_valid = configured_count > 0 and valid_count == configured_count
     
     print(f"Total services: {total}")
     print(f"Configured: {configured_count}/{total}")
-    print(f"Valid: {valid_count}/{configured_count if configured_count > 0 else total}")
+    print(f"Valid: {valid_count}/{configured_count or total}")
     print()
     
-    if valid_count == configured_count and configured_count > 0:
+    if all_valid:
         print_success("All configured API keys are valid! ✨")
     elif valid_count > 0:
         print_warning(f"{valid_count} API key(s) valid, {configured_count - valid_count} need attention")
@@ -356,22 +493,24 @@ def main():
     
     # Generate report
     print_section("Detailed Report")
-    report = generate_report(results)
-    
-    report_file = project_dir / 'api-keys-validation-report.json'
-    with open(report_file, 'w') as f:
-        f.write(report)
+    if cached is not None:
+        report = dumps_json(cached)
+        print_success(f"Cached report: {report_file}")
+    else:
+        report = generate_report(results, fingerprint)
+        
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        
+        print_success(f"Report saved to: {report_file}")
     
-    print_success(f"Report saved to: {report_file}")
-    print()
-    print("Report contents:")
-    print(report)
+    if args.print_report:
+        print()
+        print("Report contents:")
+        print(report)
     
     # Exit code
-    if valid_count == configured_count and configured_count > 0:
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    sys.exit(0 if all_valid else 1)
 
 if __name__ == '__main__':
     try: